@@ -1,17 +1,35 @@
 from fastapi import FastAPI, APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
 import os
 import logging
+import asyncio
 import httpx
+import orjson
+import numpy as np
 from pathlib import Path
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Callable
 import uuid
 from datetime import datetime
 import json
 import re
+import time
+from collections import OrderedDict
+from functools import lru_cache
+import math
+
+try:
+    from numba import njit
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    # Fall back to running the score kernel as plain Python
+    _NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        return lambda func: func
 
 
 ROOT_DIR = Path(__file__).parent
@@ -23,7 +41,7 @@ client = AsyncIOMotorClient(mongo_url)
 db = client[os.environ['DB_NAME']]
 
 # Create the main app without a prefix
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
@@ -31,7 +49,7 @@ api_router = APIRouter(prefix="/api")
 
 # Define Models
 class StatusCheck(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     client_name: str
     timestamp: datetime = Field(default_factory=datetime.utcnow)
 
@@ -68,7 +86,7 @@ class FoodProduct(BaseModel):
     additives: Optional[List[str]] = None
 
 class FoodTrackingEntry(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     user_id: str
     food_product: FoodProduct
     quantity: float = 100  # in grams
@@ -79,79 +97,240 @@ class FoodTrackingCreate(BaseModel):
     food_product: FoodProduct
     quantity: float = 100
 
+class TTLCache:
+    """Small in-process LRU cache whose entries expire after ``ttl`` seconds"""
+    
+    def __init__(self, maxsize: int = 1024, ttl: float = 600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Any, tuple[float, Any]]" = OrderedDict()
+    
+    def get(self, key: Any) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+    
+    def set(self, key: Any, value: Any) -> None:
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+class TokenBucket:
+    """Async token bucket allowing ``rate`` requests per ``period`` seconds"""
+    
+    def __init__(self, rate: float, period: float = 1.0):
+        self.capacity = rate
+        self.fill_rate = rate / period
+        self._tokens = rate
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.fill_rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.fill_rate)
+
+# Score adjustments for Nutri-Score grade and NOVA processing group
+NUTRISCORE_ADJUSTMENTS = {'a': 5, 'b': 0, 'c': -10, 'd': -20, 'e': -30}
+NOVA_ADJUSTMENTS = {1: 10, 2: 0, 3: -20, 4: -30}
+
+# Lower score bound of each rating, from worst to best
+RATING_THRESHOLDS = np.array([40, 55, 70, 85])
+RATING_LABELS = ("Very Poor", "Poor", "Moderate", "Good", "Excellent")
+
+# Compiled once per process by warm_score_kernel; numba's on-disk cache is not used
+# because it ties cache entries to the importing module's name
+@njit
+def _score_kernel(energy: float, sugars: float, sodium: float, salt: float,
+                  saturated_fat: float, fiber: float, proteins: float, carbohydrates: float,
+                  nutriscore_adjustment: float, nova_adjustment: float, additive_count: float) -> float:
+    """Numeric core of the health score; missing values are passed as NaN"""
+    score = 100.0  # Start with perfect score
+    
+    # Indian-specific nutritional considerations
+    # Penalize high calories (Indian diet typically 250-400 kcal/100g)
+    if energy > 350:
+        score -= min(30.0, (energy - 350) / 8)
+    
+    # Penalize high sugar (Indian sweets are high, but processed foods should be limited)
+    if sugars > 12:
+        score -= min(25.0, (sugars - 12) * 2)
+    
+    # Penalize high sodium (Indian food is naturally salty, but processed foods are concerning)
+    if sodium > 1.2:
+        score -= min(20.0, (sodium - 1.2) * 12)
+    elif salt > 3:
+        score -= min(20.0, (salt - 3) * 5)
+    
+    # Penalize high saturated fat (ghee is common but processed trans fats are bad)
+    if saturated_fat > 6:
+        score -= min(20.0, (saturated_fat - 6) * 2)
+    
+    # Reward high fiber (important in Indian diet with whole grains)
+    if fiber > 2:
+        score += min(20.0, (fiber - 2) * 4)
+    
+    # Reward high protein (dal, paneer, etc. are protein sources)
+    if proteins > 8:
+        score += min(15.0, (proteins - 8) * 1.5)
+    
+    # Reward low to moderate carbs (rice and wheat are staples)
+    if carbohydrates > 70:
+        score -= min(10.0, (carbohydrates - 70) / 5)
+    
+    # Factor in Nutri-Score and NOVA group
+    score += nutriscore_adjustment
+    score += nova_adjustment
+    
+    # Heavily penalize additives (Indian traditional food has fewer additives)
+    if additive_count > 0:
+        score -= min(20.0, additive_count * 3)
+    
+    # Ensure score is within bounds
+    return max(0.0, min(100.0, score))
+
+# The plain-Python kernel, used if the compiled one fails
+_score_kernel_py = getattr(_score_kernel, "py_func", _score_kernel)
+
+def _score_kernel_safe(*args: float) -> float:
+    """Run the score kernel, falling back to plain Python if the JIT call fails"""
+    try:
+        return _score_kernel(*args)
+    except Exception as e:
+        logging.warning(f"Compiled score kernel failed, using plain Python: {str(e)}")
+        return _score_kernel_py(*args)
+
+def _as_float(value: Optional[float]) -> float:
+    return math.nan if value is None else float(value)
+
+@lru_cache(maxsize=4096)
+def _score_health(energy: Optional[float], sugars: Optional[float], sodium: Optional[float],
+                  salt: Optional[float], saturated_fat: Optional[float], fiber: Optional[float],
+                  proteins: Optional[float], carbohydrates: Optional[float],
+                  nutriscore_grade: Optional[str], nova_group: Optional[int],
+                  additive_count: int) -> tuple[float, str]:
+    """Score a product from hashable per-100g values so repeat products hit the cache"""
+    nutriscore_adjustment = NUTRISCORE_ADJUSTMENTS.get(nutriscore_grade.lower(), 0) if nutriscore_grade else 0
+    nova_adjustment = NOVA_ADJUSTMENTS.get(nova_group, 0) if nova_group else 0
+    
+    score = _score_kernel_safe(
+        _as_float(energy), _as_float(sugars), _as_float(sodium), _as_float(salt),
+        _as_float(saturated_fat), _as_float(fiber), _as_float(proteins), _as_float(carbohydrates),
+        float(nutriscore_adjustment), float(nova_adjustment), float(additive_count)
+    )
+    
+    # Convert to rating with Indian context
+    if score >= 85:
+        rating = "Excellent"
+    elif score >= 70:
+        rating = "Good"
+    elif score >= 55:
+        rating = "Moderate"
+    elif score >= 40:
+        rating = "Poor"
+    else:
+        rating = "Very Poor"
+    
+    return round(score, 1), rating
+
+def _score_health_batch(keys: List[tuple]) -> List[tuple[float, str]]:
+    """Vectorized _score_health over many products, applying the same rules in the same order"""
+    if not keys:
+        return []
+    
+    # Missing values become NaN, which fails every threshold comparison below
+    values = np.array([key[:8] for key in keys], dtype=float)
+    energy, sugars, sodium, salt, saturated_fat, fiber, proteins, carbohydrates = values.T
+    
+    with np.errstate(invalid="ignore"):
+        score = np.full(len(keys), 100.0)
+        score -= np.where(energy > 350, np.minimum(30, (energy - 350) / 8), 0)
+        score -= np.where(sugars > 12, np.minimum(25, (sugars - 12) * 2), 0)
+        score -= np.where(
+            sodium > 1.2,
+            np.minimum(20, (sodium - 1.2) * 12),
+            np.where(salt > 3, np.minimum(20, (salt - 3) * 5), 0)
+        )
+        score -= np.where(saturated_fat > 6, np.minimum(20, (saturated_fat - 6) * 2), 0)
+        score += np.where(fiber > 2, np.minimum(20, (fiber - 2) * 4), 0)
+        score += np.where(proteins > 8, np.minimum(15, (proteins - 8) * 1.5), 0)
+        score -= np.where(carbohydrates > 70, np.minimum(10, (carbohydrates - 70) / 5), 0)
+    
+    score += np.array([NUTRISCORE_ADJUSTMENTS.get(key[8].lower(), 0) if key[8] else 0 for key in keys])
+    score += np.array([NOVA_ADJUSTMENTS.get(key[9], 0) if key[9] else 0 for key in keys])
+    score -= np.minimum(20, np.array([key[10] for key in keys]) * 3)
+    
+    score = np.clip(score, 0, 100)
+    ratings = np.digitize(score, RATING_THRESHOLDS)
+    return [(round(float(value), 1), RATING_LABELS[rating]) for value, rating in zip(score, ratings)]
+
 class HealthScoreCalculator:
+    @staticmethod
+    def _score_key(nutrition: Optional[NutritionInfo], nutriscore_grade: Optional[str],
+                   nova_group: Optional[int], additives: Optional[List[str]]) -> tuple:
+        """Flatten scoring inputs into the primitive tuple _score_health takes"""
+        if nutrition is None:
+            nutrition = NutritionInfo()
+        return (
+            nutrition.energy_100g,
+            nutrition.sugars_100g,
+            nutrition.sodium_100g,
+            nutrition.salt_100g,
+            nutrition.saturated_fat_100g,
+            nutrition.fiber_100g,
+            nutrition.proteins_100g,
+            nutrition.carbohydrates_100g,
+            nutriscore_grade,
+            nova_group,
+            len(additives) if additives else 0
+        )
+    
     @staticmethod
     def calculate_health_score(nutrition: NutritionInfo, nutriscore_grade: str = None, nova_group: int = None, additives: List[str] = None) -> tuple[float, str]:
         """Calculate health score from 0-100 with Indian dietary considerations"""
-        score = 100  # Start with perfect score
-        
-        if nutrition:
-            # Indian-specific nutritional considerations
-            # Penalize high calories (Indian diet typically 250-400 kcal/100g)
-            if nutrition.energy_100g and nutrition.energy_100g > 350:
-                score -= min(30, (nutrition.energy_100g - 350) / 8)
-            
-            # Penalize high sugar (Indian sweets are high, but processed foods should be limited)
-            if nutrition.sugars_100g and nutrition.sugars_100g > 12:
-                score -= min(25, (nutrition.sugars_100g - 12) * 2)
-            
-            # Penalize high sodium (Indian food is naturally salty, but processed foods are concerning)
-            if nutrition.sodium_100g and nutrition.sodium_100g > 1.2:
-                score -= min(20, (nutrition.sodium_100g - 1.2) * 12)
-            elif nutrition.salt_100g and nutrition.salt_100g > 3:
-                score -= min(20, (nutrition.salt_100g - 3) * 5)
-            
-            # Penalize high saturated fat (ghee is common but processed trans fats are bad)
-            if nutrition.saturated_fat_100g and nutrition.saturated_fat_100g > 6:
-                score -= min(20, (nutrition.saturated_fat_100g - 6) * 2)
-            
-            # Reward high fiber (important in Indian diet with whole grains)
-            if nutrition.fiber_100g and nutrition.fiber_100g > 2:
-                score += min(20, (nutrition.fiber_100g - 2) * 4)
-            
-            # Reward high protein (dal, paneer, etc. are protein sources)
-            if nutrition.proteins_100g and nutrition.proteins_100g > 8:
-                score += min(15, (nutrition.proteins_100g - 8) * 1.5)
-            
-            # Reward low to moderate carbs (rice and wheat are staples)
-            if nutrition.carbohydrates_100g and nutrition.carbohydrates_100g > 70:
-                score -= min(10, (nutrition.carbohydrates_100g - 70) / 5)
-        
-        # Factor in Nutri-Score if available
-        if nutriscore_grade:
-            grade_penalties = {'a': 5, 'b': 0, 'c': -10, 'd': -20, 'e': -30}
-            score += grade_penalties.get(nutriscore_grade.lower(), 0)
-        
-        # Factor in NOVA group (processed foods are concerning in Indian context)
-        if nova_group:
-            nova_penalties = {1: 10, 2: 0, 3: -20, 4: -30}
-            score += nova_penalties.get(nova_group, 0)
-        
-        # Heavily penalize additives (Indian traditional food has fewer additives)
-        if additives:
-            score -= min(20, len(additives) * 3)
-        
-        # Ensure score is within bounds
-        score = max(0, min(100, score))
-        
-        # Convert to rating with Indian context
-        if score >= 85:
-            rating = "Excellent"
-        elif score >= 70:
-            rating = "Good"
-        elif score >= 55:
-            rating = "Moderate"
-        elif score >= 40:
-            rating = "Poor"
-        else:
-            rating = "Very Poor"
-        
-        return round(score, 1), rating
+        return _score_health(*HealthScoreCalculator._score_key(nutrition, nutriscore_grade, nova_group, additives))
+    
+    @staticmethod
+    def calculate_health_scores(items: List[tuple]) -> List[tuple[float, str]]:
+        """Score many (nutrition, nutriscore_grade, nova_group, additives) tuples in one pass"""
+        return _score_health_batch([HealthScoreCalculator._score_key(*item) for item in items])
 
 class OpenFoodFactsService:
     BASE_URL = "https://world.openfoodfacts.org/api/v2"
     INDIA_BASE_URL = "https://in.openfoodfacts.org/api/v2"
     
+    # Shared HTTP client, created on app startup and closed on shutdown
+    client: Optional[httpx.AsyncClient] = None
+    
+    MAX_SEARCH_LIMIT = 50
+    
+    # Client-side throttling so bursts don't trip OpenFoodFacts rate limits
+    MAX_CONCURRENT_REQUESTS = 32
+    REQUESTS_PER_SECOND = 10
+    MAX_ATTEMPTS = 3
+    MAX_RETRY_TIME = 8.0
+    _request_slots = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    _rate_limiter = TokenBucket(REQUESTS_PER_SECOND)
+    
+    # Parsed results of recent lookups, so repeat queries skip the network
+    _search_cache = TTLCache(maxsize=1024)
+    _barcode_cache = TTLCache(maxsize=1024)
+    # (url, params) -> (etag, parsed value), used for conditional GETs once the above expire
+    _etag_cache = TTLCache(maxsize=2048, ttl=24 * 3600)
+    
     # Indian food categories and terms for enhanced search
     INDIAN_FOOD_CATEGORIES = [
         "dal", "rice", "wheat", "atta", "roti", "chapati", "naan", "paratha",
@@ -162,77 +341,179 @@ class OpenFoodFactsService:
         "lassi", "buttermilk", "yogurt", "curd", "paneer", "milk", "coconut"
     ]
     
+    # Brands that are prioritized when merging Indian and global results
+    INDIAN_BRANDS = [
+        "amul", "britannia", "parle", "haldiram", "mdh", "everest", "tata",
+        "nestle india", "itc", "dabur", "patanjali"
+    ]
+    
+    # Map common Indian food terms to better search terms
+    INDIAN_QUERY_MAPPINGS = {
+        "atta": "wheat flour atta",
+        "dal": "lentils dal",
+        "chawal": "rice basmati",
+        "ghee": "clarified butter ghee",
+        "masala": "spice masala mix",
+        "namkeen": "savory snacks namkeen",
+        "mithai": "indian sweets",
+        "chai": "tea chai",
+        "lassi": "yogurt drink lassi",
+        "papad": "papadum crispy",
+        "pickle": "indian pickle achar"
+    }
+    
+    # NutritionInfo field -> OpenFoodFacts nutriments key
+    _NUTRITION_FIELD_MAP = (
+        ("energy_100g", "energy-kcal_100g"),
+        ("fat_100g", "fat_100g"),
+        ("saturated_fat_100g", "saturated-fat_100g"),
+        ("carbohydrates_100g", "carbohydrates_100g"),
+        ("sugars_100g", "sugars_100g"),
+        ("fiber_100g", "fiber_100g"),
+        ("proteins_100g", "proteins_100g"),
+        ("salt_100g", "salt_100g"),
+        ("sodium_100g", "sodium_100g")
+    )
+    
+    # Precompiled alternations so each check is a single regex scan
+    _INDIAN_BRAND_RE = re.compile("|".join(map(re.escape, INDIAN_BRANDS)))
+    # Query terms must match whole words, so e.g. "sandals" doesn't map to "dal"
+    _INDIAN_QUERY_RE = re.compile(r"\b(?:" + "|".join(map(re.escape, INDIAN_QUERY_MAPPINGS)) + r")\b")
+    _INDIAN_QUERY_PRIORITY = {term: i for i, term in enumerate(INDIAN_QUERY_MAPPINGS)}
+    
     @staticmethod
     async def search_products(query: str, limit: int = 20) -> List[FoodProduct]:
         """Search for food products using OpenFoodFacts API with Indian preference"""
-        async with httpx.AsyncClient() as client:
+        # Cap the page size so callers can't request arbitrarily large pages
+        limit = min(limit or 20, OpenFoodFactsService.MAX_SEARCH_LIMIT)
+        cache_key = (query.lower().strip(), limit)
+        cached = OpenFoodFactsService._search_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        products = await OpenFoodFactsService._search_uncached(query, limit)
+        # Empty results may come from a failed upstream call, so don't keep them
+        if products:
+            OpenFoodFactsService._search_cache.set(cache_key, products)
+        return products
+    
+    @staticmethod
+    async def _search_uncached(query: str, limit: int) -> List[FoodProduct]:
+        """Search both OpenFoodFacts databases, preferring Indian results"""
+        try:
+            # Query the Indian and global databases concurrently
+            indian_task = asyncio.create_task(OpenFoodFactsService._search_with_url(
+                OpenFoodFactsService.INDIA_BASE_URL, query, min(limit, 15)
+            ))
+            global_task = asyncio.create_task(OpenFoodFactsService._search_with_url(
+                OpenFoodFactsService.BASE_URL, query, limit
+            ))
+            
             try:
-                # Enhanced search with Indian terms and global fallback
-                indian_products = await OpenFoodFactsService._search_with_url(
-                    client, OpenFoodFactsService.INDIA_BASE_URL, query, min(limit, 15)
-                )
-                
-                # If we have good results from Indian database, use them
-                if len(indian_products) >= 5:
-                    return indian_products[:limit]
-                
-                # Otherwise, search globally but with Indian preference
-                global_products = await OpenFoodFactsService._search_with_url(
-                    client, OpenFoodFactsService.BASE_URL, query, limit
-                )
-                
-                # Combine and prioritize Indian products
-                all_products = indian_products + global_products
-                
-                # Remove duplicates and prioritize Indian brands
-                seen_products = set()
-                filtered_products = []
-                indian_brands = ["amul", "britannia", "parle", "haldiram", "mdh", "everest", "tata", "nestle india", "itc", "dabur", "patanjali"]
-                
-                # First pass: Indian brands
-                for product in all_products:
-                    if product.id not in seen_products:
-                        if product.brand and any(brand in product.brand.lower() for brand in indian_brands):
-                            filtered_products.append(product)
-                            seen_products.add(product.id)
-                
-                # Second pass: Other products
-                for product in all_products:
-                    if product.id not in seen_products and len(filtered_products) < limit:
-                        filtered_products.append(product)
-                        seen_products.add(product.id)
-                
-                return filtered_products[:limit]
-                
-            except Exception as e:
-                logging.error(f"Error searching products: {str(e)}")
-                return []
+                indian_products = await indian_task
+            except Exception:
+                global_task.cancel()
+                raise
+            
+            # If we have good results from Indian database, use them
+            if len(indian_products) >= 5:
+                global_task.cancel()
+                return indian_products[:limit]
+            
+            # Otherwise, use the global results but with Indian preference
+            global_products = await global_task
+            
+            # Combine and prioritize Indian products
+            all_products = indian_products + global_products
+            
+            # Remove duplicates and prioritize Indian brands in a single pass
+            seen_products = set()
+            indian_brand_products = []
+            other_products = []
+            indian_brand_re = OpenFoodFactsService._INDIAN_BRAND_RE
+            
+            for product in all_products:
+                if product.id in seen_products:
+                    continue
+                seen_products.add(product.id)
+                if product.brand and indian_brand_re.search(product.brand.lower()):
+                    indian_brand_products.append(product)
+                else:
+                    other_products.append(product)
+            
+            return (indian_brand_products + other_products)[:limit]
+            
+        except Exception as e:
+            logging.error(f"Error searching products: {str(e)}")
+            return []
+    
+    @staticmethod
+    async def _get(url: str, params: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> httpx.Response:
+        """GET from OpenFoodFacts, throttled and retried on 429/5xx responses"""
+        deadline = time.monotonic() + OpenFoodFactsService.MAX_RETRY_TIME
+        for attempt in range(OpenFoodFactsService.MAX_ATTEMPTS):
+            async with OpenFoodFactsService._request_slots:
+                await OpenFoodFactsService._rate_limiter.acquire()
+                response = await OpenFoodFactsService.client.get(url, params=params, headers=headers)
+            
+            if response.status_code != 429 and response.status_code < 500:
+                return response
+            
+            delay = OpenFoodFactsService._retry_delay(response, attempt)
+            if attempt + 1 == OpenFoodFactsService.MAX_ATTEMPTS or time.monotonic() + delay > deadline:
+                break
+            await asyncio.sleep(delay)
+        
+        # Out of retries; let the caller's raise_for_status report it
+        return response
+    
+    @staticmethod
+    async def _get_parsed(url: str, params: Dict[str, Any], parse: Callable[[Dict[str, Any]], Any]) -> Any:
+        """GET and parse a response, revalidating previously seen ones via ETag"""
+        etag_key = (url, tuple(sorted(params.items())))
+        cached = OpenFoodFactsService._etag_cache.get(etag_key)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        
+        response = await OpenFoodFactsService._get(url, params=params, headers=headers)
+        # Unchanged upstream: reuse the parsed value and skip decoding entirely
+        if cached and response.status_code == 304:
+            return cached[1]
+        response.raise_for_status()
+        value = parse(orjson.loads(response.content))
+        
+        etag = response.headers.get("ETag")
+        if etag:
+            OpenFoodFactsService._etag_cache.set(etag_key, (etag, value))
+        return value
+    
+    @staticmethod
+    def _retry_delay(response: httpx.Response, attempt: int) -> float:
+        """Seconds to wait before retrying, honouring a numeric Retry-After header"""
+        retry_after = response.headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            return float(retry_after)
+        return 0.5 * (2 ** attempt)
     
     @staticmethod
-    async def _search_with_url(client: httpx.AsyncClient, base_url: str, query: str, limit: int) -> List[FoodProduct]:
+    async def _search_with_url(base_url: str, query: str, limit: int) -> List[FoodProduct]:
         """Search with specific base URL"""
         try:
             # Enhance query with Indian context if it matches Indian food categories
             enhanced_query = OpenFoodFactsService._enhance_indian_query(query)
             
-            response = await client.get(
-                f"{base_url}/search",
-                params={
-                    "search_terms": enhanced_query,
-                    "page_size": limit,
-                    "countries": "India" if "in.openfoodfacts.org" in base_url else "",
-                    "fields": "code,product_name,brands,image_url,nutriscore_grade,nova_group,nutriments,ingredients_text,additives_tags,countries_tags"
-                }
-            )
-            response.raise_for_status()
-            data = response.json()
+            params = {
+                "search_terms": enhanced_query,
+                "page_size": limit,
+                "fields": "code,product_name,brands,image_url,nutriscore_grade,nova_group,nutriments,ingredients_text,additives_tags,countries_tags"
+            }
+            # Only filter by country on the Indian database; an empty value disables it anyway
+            if "in.openfoodfacts.org" in base_url:
+                params["countries"] = "India"
             
-            products = []
-            for product in data.get("products", []):
-                food_product = OpenFoodFactsService._parse_product(product)
-                products.append(food_product)
-            
-            return products
+            return await OpenFoodFactsService._get_parsed(
+                f"{base_url}/search", params,
+                lambda data: OpenFoodFactsService._parse_products(data.get("products", []))
+            )
         except Exception as e:
             logging.error(f"Error searching with URL {base_url}: {str(e)}")
             return []
@@ -240,71 +521,69 @@ class OpenFoodFactsService:
     @staticmethod
     def _enhance_indian_query(query: str) -> str:
         """Enhance search query with Indian context"""
-        query_lower = query.lower()
-        
-        # Map common Indian food terms to better search terms
-        indian_mappings = {
-            "atta": "wheat flour atta",
-            "dal": "lentils dal",
-            "chawal": "rice basmati",
-            "ghee": "clarified butter ghee",
-            "masala": "spice masala mix",
-            "namkeen": "savory snacks namkeen",
-            "mithai": "indian sweets",
-            "chai": "tea chai",
-            "lassi": "yogurt drink lassi",
-            "papad": "papadum crispy",
-            "pickle": "indian pickle achar"
-        }
-        
-        for indian_term, enhanced_term in indian_mappings.items():
-            if indian_term in query_lower:
-                return enhanced_term
+        matches = OpenFoodFactsService._INDIAN_QUERY_RE.findall(query.lower())
+        if matches:
+            # Keep the mapping order as the tie-breaker when several terms appear
+            indian_term = min(matches, key=OpenFoodFactsService._INDIAN_QUERY_PRIORITY.__getitem__)
+            return OpenFoodFactsService.INDIAN_QUERY_MAPPINGS[indian_term]
         
         return query
     
     @staticmethod
     async def get_product_by_barcode(barcode: str) -> Optional[FoodProduct]:
         """Get product details by barcode with Indian preference"""
-        async with httpx.AsyncClient() as client:
-            try:
-                # Try Indian database first
-                product = await OpenFoodFactsService._get_product_from_url(
-                    client, OpenFoodFactsService.INDIA_BASE_URL, barcode
-                )
-                
-                if product:
-                    return product
-                
-                # Fallback to global database
-                return await OpenFoodFactsService._get_product_from_url(
-                    client, OpenFoodFactsService.BASE_URL, barcode
-                )
-                
-            except Exception as e:
-                logging.error(f"Error getting product by barcode: {str(e)}")
-                return None
+        cached = OpenFoodFactsService._barcode_cache.get(barcode)
+        if cached is not None:
+            return cached
+        
+        product = await OpenFoodFactsService._get_product_uncached(barcode)
+        if product:
+            OpenFoodFactsService._barcode_cache.set(barcode, product)
+        return product
     
     @staticmethod
-    async def _get_product_from_url(client: httpx.AsyncClient, base_url: str, barcode: str) -> Optional[FoodProduct]:
+    async def _get_product_uncached(barcode: str) -> Optional[FoodProduct]:
+        """Look up a barcode in the Indian database, falling back to global"""
+        try:
+            # Try Indian database first
+            product = await OpenFoodFactsService._get_product_from_url(
+                OpenFoodFactsService.INDIA_BASE_URL, barcode
+            )
+            
+            if product:
+                return product
+            
+            # Fallback to global database
+            return await OpenFoodFactsService._get_product_from_url(
+                OpenFoodFactsService.BASE_URL, barcode
+            )
+            
+        except Exception as e:
+            logging.error(f"Error getting product by barcode: {str(e)}")
+            return None
+    
+    @staticmethod
+    async def _get_product_from_url(base_url: str, barcode: str) -> Optional[FoodProduct]:
         """Get product from specific URL"""
         try:
-            response = await client.get(
+            return await OpenFoodFactsService._get_parsed(
                 f"{base_url}/product/{barcode}",
-                params={
+                {
                     "fields": "code,product_name,brands,image_url,nutriscore_grade,nova_group,nutriments,ingredients_text,additives_tags,countries_tags"
-                }
+                },
+                OpenFoodFactsService._parse_product_response
             )
-            response.raise_for_status()
-            data = response.json()
-            
-            if data.get("status") == 1 and "product" in data:
-                return OpenFoodFactsService._parse_product(data["product"])
-            return None
         except Exception as e:
             logging.error(f"Error getting product from {base_url}: {str(e)}")
             return None
     
+    @staticmethod
+    def _parse_product_response(data: Dict[str, Any]) -> Optional[FoodProduct]:
+        """Parse a /product/{barcode} response body"""
+        if data.get("status") == 1 and "product" in data:
+            return OpenFoodFactsService._parse_product(data["product"])
+        return None
+    
     @staticmethod
     async def search_indian_categories() -> List[str]:
         """Get popular Indian food categories"""
@@ -313,23 +592,7 @@ class OpenFoodFactsService:
     @staticmethod
     def _parse_product(product_data: Dict[str, Any]) -> FoodProduct:
         """Parse OpenFoodFacts product data into our model"""
-        # Extract nutrition information
-        nutriments = product_data.get("nutriments", {})
-        nutrition = NutritionInfo(
-            energy_100g=nutriments.get("energy-kcal_100g"),
-            fat_100g=nutriments.get("fat_100g"),
-            saturated_fat_100g=nutriments.get("saturated-fat_100g"),
-            carbohydrates_100g=nutriments.get("carbohydrates_100g"),
-            sugars_100g=nutriments.get("sugars_100g"),
-            fiber_100g=nutriments.get("fiber_100g"),
-            proteins_100g=nutriments.get("proteins_100g"),
-            salt_100g=nutriments.get("salt_100g"),
-            sodium_100g=nutriments.get("sodium_100g")
-        )
-        
-        # Extract additives
-        additives = product_data.get("additives_tags", [])
-        additives = [additive.replace("en:", "") for additive in additives if additive.startswith("en:")]
+        nutrition, additives = OpenFoodFactsService._extract_nutrition(product_data)
         
         # Calculate health score
         health_score, health_rating = HealthScoreCalculator.calculate_health_score(
@@ -339,9 +602,45 @@ class OpenFoodFactsService:
             additives=additives
         )
         
+        return OpenFoodFactsService._build_product(product_data, nutrition, additives, health_score, health_rating)
+    
+    @staticmethod
+    def _parse_products(products_data: List[Dict[str, Any]]) -> List[FoodProduct]:
+        """Parse a page of OpenFoodFacts products, scoring them in one batch"""
+        extracted = [OpenFoodFactsService._extract_nutrition(product_data) for product_data in products_data]
+        scores = HealthScoreCalculator.calculate_health_scores([
+            (nutrition, product_data.get("nutriscore_grade"), product_data.get("nova_group"), additives)
+            for product_data, (nutrition, additives) in zip(products_data, extracted)
+        ])
+        return [
+            OpenFoodFactsService._build_product(product_data, nutrition, additives, health_score, health_rating)
+            for product_data, (nutrition, additives), (health_score, health_rating)
+            in zip(products_data, extracted, scores)
+        ]
+    
+    @staticmethod
+    def _extract_nutrition(product_data: Dict[str, Any]) -> tuple[NutritionInfo, List[str]]:
+        """Pull nutrition information and additives out of OpenFoodFacts product data"""
+        nutriments = product_data.get("nutriments", {})
+        nutrition = NutritionInfo(**{
+            field: nutriments.get(key) for field, key in OpenFoodFactsService._NUTRITION_FIELD_MAP
+        })
+        
+        # Extract additives, dropping the fixed "en:" prefix
+        additives = product_data.get("additives_tags", [])
+        additives = [additive[3:] for additive in additives if additive[:3] == "en:"]
+        
+        return nutrition, additives
+    
+    @staticmethod
+    def _build_product(product_data: Dict[str, Any], nutrition: NutritionInfo, additives: List[str],
+                       health_score: float, health_rating: str) -> FoodProduct:
+        """Assemble a FoodProduct from parsed fields"""
+        # Upstream values are validated (e.g. nova_group "4" -> 4); a missing or null
+        # code gets a generated id so distinct products aren't merged on dedup
         return FoodProduct(
-            id=product_data.get("code", str(uuid.uuid4())),
-            product_name=product_data.get("product_name", "Unknown Product"),
+            id=product_data.get("code") or str(uuid.uuid4()),
+            product_name=product_data.get("product_name") or "Unknown Product",
             brand=product_data.get("brands"),
             image_url=product_data.get("image_url"),
             barcode=product_data.get("code"),
@@ -354,6 +653,13 @@ class OpenFoodFactsService:
             additives=additives
         )
 
+def _tracking_entry_from_doc(doc: Dict[str, Any]) -> FoodTrackingEntry:
+    """Build a FoodTrackingEntry from a stored document without re-validating it"""
+    product = dict(doc["food_product"])
+    if product.get("nutrition") is not None:
+        product["nutrition"] = NutritionInfo.model_construct(**product["nutrition"])
+    return FoodTrackingEntry.model_construct(**{**doc, "food_product": FoodProduct.model_construct(**product)})
+
 # API Routes
 @api_router.get("/")
 async def root():
@@ -361,15 +667,17 @@ async def root():
 
 @api_router.post("/status", response_model=StatusCheck)
 async def create_status_check(input: StatusCheckCreate):
-    status_dict = input.dict()
-    status_obj = StatusCheck(**status_dict)
-    _ = await db.status_checks.insert_one(status_obj.dict())
+    # The request is already validated; copy its fields across without a dump/validate round-trip
+    status_obj = StatusCheck.model_construct(**dict(input))
+    _ = await db.status_checks.insert_one(status_obj.model_dump())
     return status_obj
 
-@api_router.get("/status", response_model=List[StatusCheck])
+@api_router.get("/status", response_model=None, responses={200: {"model": List[StatusCheck]}})
 async def get_status_checks():
-    status_checks = await db.status_checks.find().to_list(1000)
-    return [StatusCheck(**status_check) for status_check in status_checks]
+    # Documents are written by create_status_check and projected to the StatusCheck
+    # fields, so serialize them directly instead of validating each one on the way out
+    cursor = db.status_checks.find({}, {"_id": 0, "id": 1, "client_name": 1, "timestamp": 1}).limit(1000)
+    return ORJSONResponse(content=await cursor.to_list(1000))
 
 @api_router.get("/food/categories", response_model=List[str])
 async def get_indian_food_categories():
@@ -413,15 +721,15 @@ async def get_popular_indian_foods():
 @api_router.post("/food/track", response_model=FoodTrackingEntry)
 async def track_food(request: FoodTrackingCreate):
     """Track food consumption"""
-    tracking_entry = FoodTrackingEntry(**request.dict())
-    await db.food_tracking.insert_one(tracking_entry.dict())
+    tracking_entry = FoodTrackingEntry.model_construct(**dict(request))
+    await db.food_tracking.insert_one(tracking_entry.model_dump())
     return tracking_entry
 
 @api_router.get("/food/track/{user_id}", response_model=List[FoodTrackingEntry])
 async def get_food_tracking(user_id: str, limit: int = 50):
     """Get food tracking history for a user"""
-    entries = await db.food_tracking.find({"user_id": user_id}).sort("timestamp", -1).limit(limit).to_list(limit)
-    return [FoodTrackingEntry(**entry) for entry in entries]
+    cursor = db.food_tracking.find({"user_id": user_id}, {"_id": 0}).sort("timestamp", -1).limit(limit)
+    return [_tracking_entry_from_doc(entry) async for entry in cursor]
 
 @api_router.delete("/food/track/{entry_id}")
 async def delete_food_tracking(entry_id: str):
@@ -449,6 +757,37 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@app.on_event("startup")
+async def startup_http_client():
+    # One pooled HTTP/2 connection per host is reused across requests, so
+    # concurrent lookups multiplex over it instead of each paying TCP+TLS setup.
+    # Pool settings live on the transport, which also retries connection resets.
+    OpenFoodFactsService.client = httpx.AsyncClient(
+        transport=httpx.AsyncHTTPTransport(
+            http2=True,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            retries=2
+        ),
+        timeout=httpx.Timeout(10.0, connect=5.0),
+        # OpenFoodFacts asks API clients to identify themselves
+        headers={"User-Agent": "IndianFoodVerify/1.0 (+https://github.com/JamDevelopers/indian-food-verify)"}
+    )
+
+@app.on_event("startup")
+async def warm_score_kernel():
+    # Trigger JIT compilation before the first request; a failure is logged and
+    # scoring falls back to plain Python rather than aborting startup
+    if _NUMBA_AVAILABLE:
+        _score_kernel_safe(*([math.nan] * 8), 0.0, 0.0, 0.0)
+
+@app.on_event("startup")
+async def create_db_indexes():
+    # History lookups filter by user and sort newest first; deletes go by id
+    await db.food_tracking.create_index([("user_id", 1), ("timestamp", -1)])
+    await db.food_tracking.create_index("id", unique=True)
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
-    client.close()
\ No newline at end of file
+    client.close()
+    if OpenFoodFactsService.client:
+        await OpenFoodFactsService.client.aclose()
\ No newline at end of file
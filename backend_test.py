@@ -6,46 +6,238 @@ Tests OpenFoodFacts integration, health scoring, and all API endpoints
 
 import asyncio
 import httpx
-import json
+import orjson
+import os
+import random
+import re
+import statistics
 import sys
 import time
-from typing import Dict, List, Any
+from collections import Counter
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List, Any, Optional
 from datetime import datetime
+from pathlib import Path
 
 # Backend URL from frontend environment
 BACKEND_URL = "https://c7246f44-97cb-4bb1-a402-26de582e1933.preview.emergentagent.com/api"
 
+# Endpoint URLs, built once rather than per request
+ROOT_URL = f"{BACKEND_URL}/"
+SEARCH_URL = f"{BACKEND_URL}/food/search"
+BARCODE_URL = f"{BACKEND_URL}/food/barcode/"
+CATEGORIES_URL = f"{BACKEND_URL}/food/categories"
+POPULAR_INDIAN_URL = f"{BACKEND_URL}/food/popular-indian"
+TRACK_URL = f"{BACKEND_URL}/food/track"
+TRACK_HISTORY_URL = f"{BACKEND_URL}/food/track/"  # + user_id
+TRACK_ENTRY_URL = f"{BACKEND_URL}/food/track/"  # + entry_id
+
+JSON_HEADERS = {"content-type": "application/json"}
+
+# Cap on requests in flight at once, so gathered tests don't overload the backend
+MAX_IN_FLIGHT = int(os.environ.get("BACKEND_TEST_CONCURRENCY", "10"))
+
+RESULTS_PATH = Path("/app/backend_test_results.json")
+
+# Fields every search result must carry
+REQUIRED_PRODUCT_FIELDS = frozenset({"id", "product_name", "health_score", "health_rating"})
+
+# Case-insensitive substring matchers for Indian brands and Indian-sounding product terms
+INDIAN_BRAND_RE = re.compile("amul|britannia|parle|haldiram|mdh|everest", re.I)
+INDIAN_TERM_RE = re.compile("basmati|dal|atta|amul|britannia|indian|masala", re.I)
+
+@dataclass(slots=True)
+class Endpoint:
+    """An endpoint exercised by the response-time checks"""
+    method: str
+    url: str
+    name: str
+    payload: Optional[dict] = None
+
+class RetryingTransport(httpx.AsyncBaseTransport):
+    """Wraps a transport, retrying 429 responses, and 5xx responses or dropped and
+    timed-out requests when resending is safe, with jittered exponential backoff"""
+    IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "DELETE"})
+    # Request extension that, set to False, sends the request exactly once
+    RETRY_EXTENSION = "retry"
+    
+    def __init__(self, transport: httpx.AsyncBaseTransport, max_retries: int = 3):
+        self._transport = transport
+        self.max_retries = max_retries
+    
+    @classmethod
+    def _is_idempotent(cls, request: httpx.Request) -> bool:
+        """Whether resending is safe even if the server already acted on the request;
+        food search is a read despite being a POST, food tracking is not"""
+        return request.method in cls.IDEMPOTENT_METHODS or str(request.url) == SEARCH_URL
+    
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if not request.extensions.get(self.RETRY_EXTENSION, True):
+            return await self._transport.handle_async_request(request)
+        idempotent = self._is_idempotent(request)
+        for attempt in range(self.max_retries):
+            try:
+                response = await self._transport.handle_async_request(request)
+            except (httpx.TimeoutException, httpx.NetworkError):
+                if not idempotent:
+                    raise
+            else:
+                # A 429 was rejected before being processed, so it's always safe to resend
+                if response.status_code != 429 and not (idempotent and response.status_code >= 500):
+                    return response
+                await response.aclose()
+            await asyncio.sleep(0.1 * 2 ** attempt + random.random() * 0.05)
+        # Last attempt: its response or error is what the test gets to log
+        return await self._transport.handle_async_request(request)
+    
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+def _json(response: httpx.Response) -> Any:
+    """Decode a response body with orjson"""
+    return orjson.loads(response.content)
+
+# Process-wide client, so every BackendTester reuses one warm connection pool
+_CLIENT: Optional[httpx.AsyncClient] = None
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared client, creating it on first use"""
+    global _CLIENT
+    if _CLIENT is None:
+        # HTTP/2 keep-alive client: one TLS session multiplexes the concurrent
+        # requests, and the pool is sized so gathered requests aren't queued.
+        # Connection failures and transient 5xx/429 responses are retried in the
+        # transport so a single blip doesn't fail a test.
+        _CLIENT = httpx.AsyncClient(
+            transport=RetryingTransport(httpx.AsyncHTTPTransport(
+                http2=True,
+                # At least MAX_IN_FLIGHT connections, so a raised cap doesn't queue on the pool;
+                # idle ones are kept through the slower test phases rather than re-handshaking
+                limits=httpx.Limits(max_connections=max(32, MAX_IN_FLIGHT),
+                                    max_keepalive_connections=max(32, MAX_IN_FLIGHT),
+                                    keepalive_expiry=60.0),
+                retries=3
+            )),
+            timeout=httpx.Timeout(30.0, connect=5.0)
+        )
+    return _CLIENT
+
+async def close_client() -> None:
+    """Close the shared client; the next get_client() builds a fresh one"""
+    global _CLIENT
+    if _CLIENT is not None:
+        await _CLIENT.aclose()
+        _CLIENT = None
+
 class BackendTester:
-    def __init__(self):
-        self.client = httpx.AsyncClient(timeout=30.0)
+    def __init__(self, verbose: bool = False):
+        self.client = get_client()
         self.test_results = []
+        # Print each result as it's logged; otherwise lines are buffered for print_results()
+        self.verbose = verbose
+        self._log_lines: List[str] = []
         self.test_user_id = "test_user_12345"
+        # Per-category tallies, keyed on each result's category
+        self._cat_pass: Counter = Counter()
+        self._cat_total: Counter = Counter()
+        # Request key -> task for the in-flight or finished (200) response
+        self._request_cache: Dict[tuple, asyncio.Task] = {}
+        self._sem = asyncio.Semaphore(MAX_IN_FLIGHT)
         
     async def close(self):
-        await self.client.aclose()
+        """Release this tester; the shared client stays open for later testers"""
+    
+    async def __aenter__(self) -> "BackendTester":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+    
+    async def _get(self, url: str) -> httpx.Response:
+        """GET, waiting for a free request slot"""
+        async with self._sem:
+            return await self.client.get(url)
+    
+    async def _delete(self, url: str) -> httpx.Response:
+        """DELETE, waiting for a free request slot"""
+        async with self._sem:
+            return await self.client.delete(url)
+    
+    async def _post(self, url: str, payload: Any) -> httpx.Response:
+        """POST a JSON body encoded with orjson; bytes are sent as already-encoded JSON"""
+        content = payload if isinstance(payload, bytes) else orjson.dumps(payload)
+        async with self._sem:
+            return await self.client.post(url, content=content, headers=JSON_HEADERS)
+    
+    def _memoized(self, key: tuple, request: Callable[[], Awaitable[httpx.Response]]) -> asyncio.Task:
+        """Issue a request once per key; concurrent and later callers share its response"""
+        # No await between lookup and insert, so this is race-free on the event loop
+        task = self._request_cache.get(key)
+        if task is None:
+            task = asyncio.create_task(request())
+            task.add_done_callback(lambda done: self._evict_unless_ok(key, done))
+            self._request_cache[key] = task
+        return task
     
-    def log_test(self, test_name: str, success: bool, message: str, response_data: Any = None):
-        """Log test results"""
+    def _evict_unless_ok(self, key: tuple, task: asyncio.Task) -> None:
+        """Drop a finished request from the memo unless it returned 200, so callers retry"""
+        if task.cancelled() or task.exception() or task.result().status_code != 200:
+            if self._request_cache.get(key) is task:
+                del self._request_cache[key]
+    
+    async def _search(self, query: str, limit: int, body: Optional[bytes] = None) -> httpx.Response:
+        """POST a food search once per (query, limit)"""
+        return await self._memoized(
+            ("POST", SEARCH_URL, query, limit),
+            lambda: self._post(SEARCH_URL, body or {"query": query, "limit": limit})
+        )
+    
+    async def _cached_get(self, url: str) -> httpx.Response:
+        """GET a read-only URL once; don't use for latency probes or state that tests change"""
+        return await self._memoized(("GET", url), lambda: self._get(url))
+    
+    def log_test(self, test_name: str, success: bool, message: str, response_data: Any = None,
+                 category: Optional[str] = None):
+        """Log test results, tallied under category (default: the test name up to " - ")"""
+        category = category or test_name.split(" - ", 1)[0]
         result = {
             "test": test_name,
+            "category": category,
             "success": success,
             "message": message,
-            "timestamp": datetime.now().isoformat(),
+            # Raw epoch seconds; converted to a datetime only when results are saved
+            "timestamp": time.time(),
             "response_data": response_data
         }
         self.test_results.append(result)
+        self._cat_total[category] += 1
+        self._cat_pass[category] += success
         status = "✅ PASS" if success else "❌ FAIL"
-        print(f"{status} {test_name}: {message}")
+        line = f"{status} {test_name}: {message}"
         if response_data and not success:
-            print(f"   Response: {json.dumps(response_data, indent=2)}")
+            line += f"\n   Response: {orjson.dumps(response_data, option=orjson.OPT_INDENT_2).decode()}"
+        if self.verbose:
+            print(line)
+        else:
+            self._log_lines.append(line)
+    
+    def print_results(self):
+        """Print the buffered result lines in one write"""
+        if self._log_lines:
+            print("\n".join(self._log_lines))
+            self._log_lines.clear()
+    
+    def _tally(self, category: str) -> tuple[int, int]:
+        """(passed, total) for a test category"""
+        return self._cat_pass[category], self._cat_total[category]
     
     async def test_api_health(self):
         """Test basic API health"""
         try:
-            response = await self.client.get(f"{BACKEND_URL}/")
+            response = await self._cached_get(ROOT_URL)
             if response.status_code == 200:
-                data = response.json()
-                self.log_test("API Health Check", True, f"API is responding: {data.get('message', 'OK')}")
+                data = _json(response)
+                self.log_test("API Health Check", True, f"API is responding over {response.http_version}: {data.get('message', 'OK')}")
                 return True
             else:
                 self.log_test("API Health Check", False, f"API returned status {response.status_code}", response.text)
@@ -57,43 +249,42 @@ class BackendTester:
     async def test_food_search_real_products(self):
         """Test food search with real product queries"""
         test_queries = ["coca cola", "apple", "bread", "banana", "milk"]
+        # Encode every request body up front; only the query differs between them
+        bodies = {query: orjson.dumps({"query": query, "limit": 5}) for query in test_queries}
         
-        for query in test_queries:
+        async def _one_query(query):
+            name = f"Food Search - {query}"
             try:
-                payload = {"query": query, "limit": 5}
-                response = await self.client.post(f"{BACKEND_URL}/food/search", json=payload)
+                response = await self._search(query, 5, bodies[query])
                 
                 if response.status_code == 200:
-                    products = response.json()
+                    products = _json(response)
                     if isinstance(products, list) and len(products) > 0:
                         # Check first product structure
                         product = products[0]
-                        required_fields = ["id", "product_name", "health_score", "health_rating"]
-                        missing_fields = [field for field in required_fields if field not in product]
+                        missing_fields = REQUIRED_PRODUCT_FIELDS - product.keys()
                         
                         if not missing_fields:
-                            self.log_test(f"Food Search - {query}", True, 
-                                        f"Found {len(products)} products, first: {product['product_name']}")
-                        else:
-                            self.log_test(f"Food Search - {query}", False, 
-                                        f"Missing required fields: {missing_fields}", product)
-                    else:
-                        self.log_test(f"Food Search - {query}", False, "No products returned", products)
-                else:
-                    self.log_test(f"Food Search - {query}", False, 
-                                f"Search failed with status {response.status_code}", response.text)
+                            return (name, True, f"Found {len(products)} products, first: {product['product_name']}", None)
+                        return (name, False, f"Missing required fields: {sorted(missing_fields)}", product)
+                    return (name, False, "No products returned", products)
+                return (name, False, f"Search failed with status {response.status_code}", response.text)
             except Exception as e:
-                self.log_test(f"Food Search - {query}", False, f"Search error: {str(e)}")
+                return (name, False, f"Search error: {str(e)}", None)
+        
+        # Queries are independent, so issue them concurrently and log in order
+        results = await asyncio.gather(*[_one_query(query) for query in test_queries])
+        for result in results:
+            self.log_test(*result)
     
     async def test_health_scoring_algorithm(self):
         """Test health scoring algorithm with known products"""
         try:
-            # Test with Coca Cola (should have poor health score)
-            payload = {"query": "coca cola", "limit": 1}
-            response = await self.client.post(f"{BACKEND_URL}/food/search", json=payload)
+            # Test with Coca Cola (should have poor health score); reuses the food search request
+            response = await self._search("coca cola", 5)
             
             if response.status_code == 200:
-                products = response.json()
+                products = _json(response)
                 if products:
                     product = products[0]
                     health_score = product.get("health_score")
@@ -114,11 +305,10 @@ class BackendTester:
                     self.log_test("Health Scoring - Coca Cola", False, "No products found for scoring test")
             
             # Test with Apple (should have good health score)
-            payload = {"query": "apple fresh", "limit": 1}
-            response = await self.client.post(f"{BACKEND_URL}/food/search", json=payload)
+            response = await self._search("apple fresh", 1)
             
             if response.status_code == 200:
-                products = response.json()
+                products = _json(response)
                 if products:
                     product = products[0]
                     health_score = product.get("health_score")
@@ -137,7 +327,7 @@ class BackendTester:
                                     "Missing health score or rating", product)
                         
         except Exception as e:
-            self.log_test("Health Scoring Algorithm", False, f"Scoring test error: {str(e)}")
+            self.log_test("Health Scoring Algorithm", False, f"Scoring test error: {str(e)}", category="Health Scoring")
     
     async def test_barcode_lookup(self):
         """Test barcode lookup functionality"""
@@ -149,53 +339,56 @@ class BackendTester:
             "0012000161155"   # US product
         ]
         
-        successful_lookups = 0
-        
-        for barcode in test_barcodes:
+        async def _one_lookup(barcode):
+            name = f"Barcode Lookup - {barcode}"
             try:
-                response = await self.client.get(f"{BACKEND_URL}/food/barcode/{barcode}")
+                # Memoized: the enhanced lookup test fetches several of the same barcodes
+                response = await self._cached_get(BARCODE_URL + barcode)
+                if response.status_code == 404:
+                    return (name, True, "Product not found (expected for some barcodes)", None), False
                 
                 if response.status_code == 200:
-                    product = response.json()
+                    product = _json(response)
                     if product.get("product_name"):
-                        successful_lookups += 1
-                        self.log_test(f"Barcode Lookup - {barcode}", True, 
-                                    f"Found: {product['product_name']}")
-                    else:
-                        self.log_test(f"Barcode Lookup - {barcode}", False, 
-                                    "Product found but missing name", product)
-                elif response.status_code == 404:
-                    self.log_test(f"Barcode Lookup - {barcode}", True, 
-                                "Product not found (expected for some barcodes)")
-                else:
-                    self.log_test(f"Barcode Lookup - {barcode}", False, 
-                                f"Unexpected status {response.status_code}", response.text)
-                    
+                        return (name, True, f"Found: {product['product_name']}", None), True
+                    return (name, False, "Product found but missing name", product), False
+                return (name, False, f"Unexpected status {response.status_code}", response.text), False
             except Exception as e:
-                self.log_test(f"Barcode Lookup - {barcode}", False, f"Lookup error: {str(e)}")
+                return (name, False, f"Lookup error: {str(e)}", None), False
+        
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(_one_lookup(barcode)) for barcode in test_barcodes]
+        
+        successful_lookups = 0
+        for task in tasks:
+            result, found = task.result()
+            self.log_test(*result)
+            successful_lookups += found
         
         # Overall barcode functionality test
         if successful_lookups > 0:
             self.log_test("Barcode Lookup Functionality", True, 
-                        f"Successfully looked up {successful_lookups} products")
+                        f"Successfully looked up {successful_lookups} products",
+                        category="Barcode Lookup")
         else:
             self.log_test("Barcode Lookup Functionality", False, 
-                        "No successful barcode lookups")
+                        "No successful barcode lookups",
+                        category="Barcode Lookup")
     
     async def test_food_tracking(self):
         """Test food tracking functionality"""
         try:
-            # First, get a product to track
-            search_payload = {"query": "banana", "limit": 1}
-            search_response = await self.client.post(f"{BACKEND_URL}/food/search", json=search_payload)
+            # First, get a product to track; any banana result will do, so reuse the
+            # search the real-products test already makes instead of sending a limit-1 one
+            search_response = await self._search("banana", 5)
             
             if search_response.status_code != 200:
-                self.log_test("Food Tracking Setup", False, "Could not get product for tracking test")
+                self.log_test("Food Tracking Setup", False, "Could not get product for tracking test", category="Food Tracking")
                 return
             
-            products = search_response.json()
+            products = _json(search_response)
             if not products:
-                self.log_test("Food Tracking Setup", False, "No products found for tracking test")
+                self.log_test("Food Tracking Setup", False, "No products found for tracking test", category="Food Tracking")
                 return
             
             test_product = products[0]
@@ -207,10 +400,10 @@ class BackendTester:
                 "quantity": 150.0
             }
             
-            track_response = await self.client.post(f"{BACKEND_URL}/food/track", json=track_payload)
+            track_response = await self._post(TRACK_URL, track_payload)
             
             if track_response.status_code == 200:
-                tracking_entry = track_response.json()
+                tracking_entry = _json(track_response)
                 entry_id = tracking_entry.get("id")
                 
                 if entry_id:
@@ -218,16 +411,16 @@ class BackendTester:
                                 f"Successfully tracked {test_product['product_name']}")
                     
                     # Test retrieving tracking history
-                    history_response = await self.client.get(f"{BACKEND_URL}/food/track/{self.test_user_id}")
+                    history_response = await self._get(TRACK_HISTORY_URL + self.test_user_id)
                     
                     if history_response.status_code == 200:
-                        history = history_response.json()
+                        history = _json(history_response)
                         if isinstance(history, list) and len(history) > 0:
                             self.log_test("Food Tracking - Get History", True, 
                                         f"Retrieved {len(history)} tracking entries")
                             
                             # Test deleting tracking entry
-                            delete_response = await self.client.delete(f"{BACKEND_URL}/food/track/{entry_id}")
+                            delete_response = await self._delete(TRACK_ENTRY_URL + entry_id)
                             
                             if delete_response.status_code == 200:
                                 self.log_test("Food Tracking - Delete Entry", True, 
@@ -254,33 +447,47 @@ class BackendTester:
     async def test_api_response_times(self):
         """Test API response times"""
         endpoints_to_test = [
-            ("GET", f"{BACKEND_URL}/", "API Root"),
-            ("POST", f"{BACKEND_URL}/food/search", "Food Search", {"query": "apple", "limit": 5})
+            Endpoint("GET", ROOT_URL, "API Root"),
+            Endpoint("POST", SEARCH_URL, "Food Search", {"query": "apple", "limit": 5})
         ]
         
-        for method, url, name, *payload in endpoints_to_test:
-            try:
-                start_time = time.time()
-                
-                if method == "GET":
-                    response = await self.client.get(url)
+        samples_per_endpoint = 20
+        
+        async def _timed(endpoint, body):
+            # Timed once a request slot is held, so queueing behind other tests isn't counted,
+            # and sent without retries so failures and backoff don't hide in the samples
+            no_retry = {RetryingTransport.RETRY_EXTENSION: False}
+            async with self._sem:
+                start_time = time.perf_counter_ns()
+                if endpoint.method == "GET":
+                    response = await self.client.get(endpoint.url, extensions=no_retry)
                 else:
-                    response = await self.client.post(url, json=payload[0] if payload else {})
-                
-                response_time = time.time() - start_time
+                    response = await self.client.post(endpoint.url, content=body, headers=JSON_HEADERS,
+                                                      extensions=no_retry)
+                return (time.perf_counter_ns() - start_time) / 1e9, response.status_code
+        
+        async def _one_endpoint(endpoint):
+            name = f"Response Time - {endpoint.name}"
+            try:
+                # Encode the POST body once for all of this endpoint's samples
+                body = orjson.dumps(endpoint.payload or {}) if endpoint.method != "GET" else None
+                samples = await asyncio.gather(*[_timed(endpoint, body) for _ in range(samples_per_endpoint)])
+                failed = [status for _, status in samples if status != 200]
+                cuts = statistics.quantiles([elapsed for elapsed, _ in samples], n=100, method="inclusive")
+                p50, p95, p99 = cuts[49], cuts[94], cuts[98]
                 
-                if response.status_code == 200 and response_time < 10.0:  # 10 second timeout
-                    self.log_test(f"Response Time - {name}", True, 
-                                f"Responded in {response_time:.2f}s")
-                elif response_time >= 10.0:
-                    self.log_test(f"Response Time - {name}", False, 
-                                f"Too slow: {response_time:.2f}s")
-                else:
-                    self.log_test(f"Response Time - {name}", False, 
-                                f"Failed with status {response.status_code}")
-                    
+                if not failed and p95 < 10.0:  # 10 second timeout
+                    return (name, True, f"p50 {p50:.2f}s, p95 {p95:.2f}s, p99 {p99:.2f}s over {len(samples)} requests")
+                if p95 >= 10.0:
+                    return (name, False, f"Too slow: p95 {p95:.2f}s over {len(samples)} requests")
+                return (name, False, f"Failed with status {failed[0]} ({len(failed)}/{len(samples)} requests)")
             except Exception as e:
-                self.log_test(f"Response Time - {name}", False, f"Error: {str(e)}")
+                return (name, False, f"Error: {str(e)}")
+        
+        # Sample every endpoint at once; the request semaphore still bounds the total
+        results = await asyncio.gather(*[_one_endpoint(endpoint) for endpoint in endpoints_to_test])
+        for result in results:
+            self.log_test(*result)
     
     async def test_indian_food_search(self):
         """Test Indian OpenFoodFacts Integration with Indian food terms"""
@@ -289,49 +496,50 @@ class BackendTester:
             "britannia biscuit", "haldiram namkeen", "chana dal", "ghee"
         ]
         
-        successful_searches = 0
-        
-        for term in indian_food_terms:
+        async def _one_term(term):
+            name = f"Indian Food Search - {term}"
             try:
-                payload = {"query": term, "limit": 10}
-                response = await self.client.post(f"{BACKEND_URL}/food/search", json=payload)
+                response = await self._search(term, 10)
                 
                 if response.status_code == 200:
-                    products = response.json()
+                    products = _json(response)
                     if isinstance(products, list) and len(products) > 0:
-                        successful_searches += 1
                         # Check if products have proper structure
                         product = products[0]
                         has_health_score = product.get("health_score") is not None
                         has_health_rating = product.get("health_rating") is not None
                         
-                        self.log_test(f"Indian Food Search - {term}", True, 
-                                    f"Found {len(products)} products, health scoring: {has_health_score and has_health_rating}")
-                    else:
-                        self.log_test(f"Indian Food Search - {term}", False, 
-                                    f"No products found for Indian term: {term}")
-                else:
-                    self.log_test(f"Indian Food Search - {term}", False, 
-                                f"Search failed with status {response.status_code}")
-                    
+                        return (name, True, 
+                                f"Found {len(products)} products, health scoring: {has_health_score and has_health_rating}"), True
+                    return (name, False, f"No products found for Indian term: {term}"), False
+                return (name, False, f"Search failed with status {response.status_code}"), False
             except Exception as e:
-                self.log_test(f"Indian Food Search - {term}", False, f"Search error: {str(e)}")
+                return (name, False, f"Search error: {str(e)}"), False
+        
+        # Terms are independent, so search them concurrently and log in order
+        results = await asyncio.gather(*[_one_term(term) for term in indian_food_terms])
+        successful_searches = 0
+        for result, found in results:
+            self.log_test(*result)
+            successful_searches += found
         
         # Overall Indian search functionality
         if successful_searches >= len(indian_food_terms) * 0.6:  # At least 60% success
             self.log_test("Indian OpenFoodFacts Integration", True, 
-                        f"Successfully searched {successful_searches}/{len(indian_food_terms)} Indian terms")
+                        f"Successfully searched {successful_searches}/{len(indian_food_terms)} Indian terms",
+                        category="Indian Food Search")
         else:
             self.log_test("Indian OpenFoodFacts Integration", False, 
-                        f"Only {successful_searches}/{len(indian_food_terms)} Indian searches successful")
+                        f"Only {successful_searches}/{len(indian_food_terms)} Indian searches successful",
+                        category="Indian Food Search")
     
     async def test_indian_food_categories(self):
         """Test Indian Food Categories API endpoint"""
         try:
-            response = await self.client.get(f"{BACKEND_URL}/food/categories")
+            response = await self._cached_get(CATEGORIES_URL)
             
             if response.status_code == 200:
-                categories = response.json()
+                categories = _json(response)
                 if isinstance(categories, list) and len(categories) > 0:
                     # Check for expected Indian categories
                     expected_categories = ["dal", "rice", "atta", "ghee", "masala", "namkeen"]
@@ -355,75 +563,67 @@ class BackendTester:
     
     async def test_indian_brand_prioritization(self):
         """Test Indian Brand Prioritization in search results"""
-        indian_brands = ["amul", "britannia", "parle", "haldiram", "mdh", "everest"]
-        
         # Test with generic terms that should return Indian brands first
         test_terms = ["milk", "biscuit", "spices", "namkeen"]
         
-        brand_prioritization_working = 0
-        
-        for term in test_terms:
+        async def _one_term(term):
+            name = f"Indian Brand Priority - {term}"
             try:
-                payload = {"query": term, "limit": 10}
-                response = await self.client.post(f"{BACKEND_URL}/food/search", json=payload)
+                response = await self._search(term, 10)
                 
                 if response.status_code == 200:
-                    products = response.json()
+                    products = _json(response)
                     if products:
                         # Check if any of the first 3 results have Indian brands
                         top_products = products[:3]
-                        indian_brand_found = False
-                        
-                        for product in top_products:
-                            brand = product.get("brand", "").lower()
-                            if any(indian_brand in brand for indian_brand in indian_brands):
-                                indian_brand_found = True
-                                break
+                        indian_brand_found = any(INDIAN_BRAND_RE.search(product.get("brand", ""))
+                                                 for product in top_products)
                         
                         if indian_brand_found:
-                            brand_prioritization_working += 1
-                            self.log_test(f"Indian Brand Priority - {term}", True, 
-                                        f"Indian brand found in top 3 results")
-                        else:
-                            self.log_test(f"Indian Brand Priority - {term}", False, 
-                                        f"No Indian brands in top 3 results for {term}")
-                    else:
-                        self.log_test(f"Indian Brand Priority - {term}", False, 
-                                    f"No products found for {term}")
-                        
+                            return (name, True, f"Indian brand found in top 3 results"), True
+                        return (name, False, f"No Indian brands in top 3 results for {term}"), False
+                    return (name, False, f"No products found for {term}"), False
+                # Non-200 responses were never logged per term
+                return None, False
             except Exception as e:
-                self.log_test(f"Indian Brand Priority - {term}", False, f"Brand priority test error: {str(e)}")
+                return (name, False, f"Brand priority test error: {str(e)}"), False
+        
+        results = await asyncio.gather(*[_one_term(term) for term in test_terms])
+        brand_prioritization_working = 0
+        for result, working in results:
+            if result:
+                self.log_test(*result)
+            brand_prioritization_working += working
         
         # Overall brand prioritization assessment
         if brand_prioritization_working >= len(test_terms) * 0.5:  # At least 50% success
             self.log_test("Indian Brand Prioritization", True, 
-                        f"Brand prioritization working for {brand_prioritization_working}/{len(test_terms)} terms")
+                        f"Brand prioritization working for {brand_prioritization_working}/{len(test_terms)} terms",
+                        category="Indian Brand Priority")
         else:
             self.log_test("Indian Brand Prioritization", False, 
-                        f"Brand prioritization only working for {brand_prioritization_working}/{len(test_terms)} terms")
+                        f"Brand prioritization only working for {brand_prioritization_working}/{len(test_terms)} terms",
+                        category="Indian Brand Priority")
     
     async def test_popular_indian_foods_api(self):
         """Test Popular Indian Foods API endpoint"""
         try:
-            response = await self.client.get(f"{BACKEND_URL}/food/popular-indian")
+            response = await self._cached_get(POPULAR_INDIAN_URL)
             
             if response.status_code == 200:
-                products = response.json()
+                products = _json(response)
                 if isinstance(products, list) and len(products) > 0:
                     # Check product structure and content
                     valid_products = 0
                     indian_products = 0
                     
                     for product in products:
-                        if all(key in product for key in ["id", "product_name", "health_score"]):
+                        if {"id", "product_name", "health_score"} <= product.keys():
                             valid_products += 1
                             
                             # Check if product seems Indian-related
-                            name = product.get("product_name", "").lower()
-                            brand = product.get("brand", "").lower()
-                            indian_terms = ["basmati", "dal", "atta", "amul", "britannia", "indian", "masala"]
-                            
-                            if any(term in name or term in brand for term in indian_terms):
+                            if (INDIAN_TERM_RE.search(product.get("product_name", ""))
+                                    or INDIAN_TERM_RE.search(product.get("brand", ""))):
                                 indian_products += 1
                     
                     if valid_products >= len(products) * 0.8:  # 80% valid structure
@@ -462,54 +662,49 @@ class BackendTester:
             "0012000161155"   # US product
         ]
         
-        indian_lookups = 0
-        total_lookups = 0
-        
-        # Test Indian barcodes
-        for barcode in indian_barcodes:
+        async def _indian_lookup(barcode):
+            name = f"Enhanced Barcode - Indian {barcode}"
             try:
-                response = await self.client.get(f"{BACKEND_URL}/food/barcode/{barcode}")
-                total_lookups += 1
+                response = await self._cached_get(BARCODE_URL + barcode)
                 
                 if response.status_code == 200:
-                    product = response.json()
+                    product = _json(response)
                     if product.get("product_name"):
-                        indian_lookups += 1
-                        self.log_test(f"Enhanced Barcode - Indian {barcode}", True, 
-                                    f"Found Indian product: {product['product_name']}")
-                    else:
-                        self.log_test(f"Enhanced Barcode - Indian {barcode}", False, 
-                                    "Product found but missing name")
-                elif response.status_code == 404:
-                    self.log_test(f"Enhanced Barcode - Indian {barcode}", True, 
-                                "Product not found (acceptable for test barcodes)")
-                else:
-                    self.log_test(f"Enhanced Barcode - Indian {barcode}", False, 
-                                f"Unexpected status {response.status_code}")
-                    
+                        return (name, True, f"Found Indian product: {product['product_name']}")
+                    return (name, False, "Product found but missing name")
+                if response.status_code == 404:
+                    return (name, True, "Product not found (acceptable for test barcodes)")
+                return (name, False, f"Unexpected status {response.status_code}")
             except Exception as e:
-                self.log_test(f"Enhanced Barcode - Indian {barcode}", False, f"Lookup error: {str(e)}")
+                return (name, False, f"Lookup error: {str(e)}")
         
-        # Test international barcodes for comparison
-        for barcode in international_barcodes:
+        # International barcodes are only logged on a hit or a clean 404
+        async def _international_lookup(barcode):
+            name = f"Enhanced Barcode - International {barcode}"
             try:
-                response = await self.client.get(f"{BACKEND_URL}/food/barcode/{barcode}")
+                response = await self._cached_get(BARCODE_URL + barcode)
                 
                 if response.status_code == 200:
-                    product = response.json()
+                    product = _json(response)
                     if product.get("product_name"):
-                        self.log_test(f"Enhanced Barcode - International {barcode}", True, 
-                                    f"Found: {product['product_name']}")
+                        return (name, True, f"Found: {product['product_name']}")
                 elif response.status_code == 404:
-                    self.log_test(f"Enhanced Barcode - International {barcode}", True, 
-                                "Product not found (acceptable)")
-                    
+                    return (name, True, "Product not found (acceptable)")
+                return None
             except Exception as e:
-                self.log_test(f"Enhanced Barcode - International {barcode}", False, f"Lookup error: {str(e)}")
+                return (name, False, f"Lookup error: {str(e)}")
+        
+        # Look up both sets concurrently; results are logged Indian first, in list order
+        results = await asyncio.gather(*[_indian_lookup(barcode) for barcode in indian_barcodes],
+                                       *[_international_lookup(barcode) for barcode in international_barcodes])
+        for result in results:
+            if result:
+                self.log_test(*result)
         
         # Overall enhanced barcode functionality
         self.log_test("Enhanced Barcode Lookup", True, 
-                    f"Barcode lookup functionality working (tested {len(indian_barcodes + international_barcodes)} barcodes)")
+                    f"Barcode lookup functionality working (tested {len(indian_barcodes + international_barcodes)} barcodes)",
+                    category="Enhanced Barcode")
     
     async def test_indian_nutritional_guidelines(self):
         """Test Indian Nutritional Guidelines in health scoring"""
@@ -522,15 +717,13 @@ class BackendTester:
             ("namkeen", "should have poor score (high sodium, processed)")
         ]
         
-        scoring_appropriate = 0
-        
-        for product_term, expectation in test_products:
+        async def _one_product(product_term, expectation):
+            name = f"Indian Nutrition - {product_term}"
             try:
-                payload = {"query": product_term, "limit": 3}
-                response = await self.client.post(f"{BACKEND_URL}/food/search", json=payload)
+                response = await self._search(product_term, 3)
                 
                 if response.status_code == 200:
-                    products = response.json()
+                    products = _json(response)
                     if products:
                         product = products[0]
                         health_score = product.get("health_score")
@@ -549,53 +742,63 @@ class BackendTester:
                                 score_reasonable = False
                             
                             if score_reasonable:
-                                scoring_appropriate += 1
-                                self.log_test(f"Indian Nutrition - {product_term}", True, 
-                                            f"Score {health_score} ({health_rating}) - {expectation}")
-                            else:
-                                self.log_test(f"Indian Nutrition - {product_term}", False, 
-                                            f"Score {health_score} seems inappropriate - {expectation}")
-                        else:
-                            self.log_test(f"Indian Nutrition - {product_term}", False, 
-                                        "Missing health score or rating")
-                    else:
-                        self.log_test(f"Indian Nutrition - {product_term}", False, 
-                                    f"No products found for {product_term}")
-                        
+                                return (name, True, f"Score {health_score} ({health_rating}) - {expectation}"), True
+                            return (name, False, f"Score {health_score} seems inappropriate - {expectation}"), False
+                        return (name, False, "Missing health score or rating"), False
+                    return (name, False, f"No products found for {product_term}"), False
+                # Non-200 responses were never logged per term
+                return None, False
             except Exception as e:
-                self.log_test(f"Indian Nutrition - {product_term}", False, f"Nutrition test error: {str(e)}")
+                return (name, False, f"Nutrition test error: {str(e)}"), False
+        
+        results = await asyncio.gather(*[_one_product(term, expectation) for term, expectation in test_products])
+        scoring_appropriate = 0
+        for result, appropriate in results:
+            if result:
+                self.log_test(*result)
+            scoring_appropriate += appropriate
         
         # Overall Indian nutritional guidelines assessment
         if scoring_appropriate >= len(test_products) * 0.6:  # At least 60% appropriate
             self.log_test("Indian Nutritional Guidelines", True, 
-                        f"Health scoring appropriate for {scoring_appropriate}/{len(test_products)} Indian food types")
+                        f"Health scoring appropriate for {scoring_appropriate}/{len(test_products)} Indian food types",
+                        category="Indian Nutrition")
         else:
             self.log_test("Indian Nutritional Guidelines", False, 
-                        f"Health scoring only appropriate for {scoring_appropriate}/{len(test_products)} Indian food types")
+                        f"Health scoring only appropriate for {scoring_appropriate}/{len(test_products)} Indian food types",
+                        category="Indian Nutrition")
 
     async def test_error_handling(self):
         """Test API error handling"""
-        try:
-            # Test invalid barcode
-            response = await self.client.get(f"{BACKEND_URL}/food/barcode/invalid_barcode")
-            if response.status_code == 404:
-                self.log_test("Error Handling - Invalid Barcode", True, 
-                            "Correctly returned 404 for invalid barcode")
-            else:
-                self.log_test("Error Handling - Invalid Barcode", False, 
-                            f"Expected 404, got {response.status_code}")
-            
-            # Test empty search query
-            response = await self.client.post(f"{BACKEND_URL}/food/search", json={"query": "", "limit": 5})
-            if response.status_code in [200, 400]:  # Either empty results or validation error is acceptable
-                self.log_test("Error Handling - Empty Search", True, 
-                            f"Handled empty search appropriately (status {response.status_code})")
-            else:
-                self.log_test("Error Handling - Empty Search", False, 
-                            f"Unexpected status {response.status_code}")
-                
-        except Exception as e:
-            self.log_test("Error Handling", False, f"Error handling test failed: {str(e)}")
+        async def _status(method, url, **kwargs):
+            # Only the status code matters here, so stream and close without reading
+            # the body (FastAPI GET routes reject HEAD with 405)
+            async with self._sem, self.client.stream(method, url, **kwargs) as response:
+                return response.status_code
+        
+        # The two probes are independent, so send them together
+        invalid_barcode, empty_search = await asyncio.gather(
+            _status("GET", BARCODE_URL + "invalid_barcode"),
+            _status("POST", SEARCH_URL, content=orjson.dumps({"query": "", "limit": 5}), headers=JSON_HEADERS),
+            return_exceptions=True
+        )
+        
+        # Test invalid barcode
+        if isinstance(invalid_barcode, Exception):
+            self.log_test("Error Handling", False, f"Error handling test failed: {str(invalid_barcode)}")
+        else:
+            ok = invalid_barcode == 404
+            self.log_test("Error Handling - Invalid Barcode", ok, 
+                        "Correctly returned 404 for invalid barcode" if ok else f"Expected 404, got {invalid_barcode}")
+        
+        # Test empty search query
+        if isinstance(empty_search, Exception):
+            self.log_test("Error Handling", False, f"Error handling test failed: {str(empty_search)}")
+        else:
+            ok = empty_search in (200, 400)  # Either empty results or validation error is acceptable
+            self.log_test("Error Handling - Empty Search", ok, 
+                        f"Handled empty search appropriately (status {empty_search})" if ok
+                        else f"Unexpected status {empty_search}")
     
     async def run_all_tests(self):
         """Run all backend tests"""
@@ -605,22 +808,35 @@ class BackendTester:
         
         # Test API health first
         if not await self.test_api_health():
+            self.print_results()
             print("❌ API is not responding. Stopping tests.")
             return
         
-        # Run all tests
-        await self.test_food_search_real_products()
-        await self.test_indian_food_search()
-        await self.test_indian_food_categories()
-        await self.test_indian_brand_prioritization()
-        await self.test_popular_indian_foods_api()
-        await self.test_enhanced_barcode_lookup()
-        await self.test_indian_nutritional_guidelines()
-        await self.test_health_scoring_algorithm()
-        await self.test_barcode_lookup()
-        await self.test_food_tracking()
-        await self.test_api_response_times()
-        await self.test_error_handling()
+        # Run all tests concurrently; they share no state beyond the append-only
+        # results list, so in verbose mode output lines may interleave
+        # Each test paired with the category its results are summarised under
+        tests = [
+            (self.test_food_search_real_products, "Food Search"),
+            (self.test_indian_food_search, "Indian Food Search"),
+            (self.test_indian_food_categories, "Indian Food Categories API"),
+            (self.test_indian_brand_prioritization, "Indian Brand Priority"),
+            (self.test_popular_indian_foods_api, "Popular Indian Foods API"),
+            (self.test_enhanced_barcode_lookup, "Enhanced Barcode"),
+            (self.test_indian_nutritional_guidelines, "Indian Nutrition"),
+            (self.test_health_scoring_algorithm, "Health Scoring"),
+            (self.test_barcode_lookup, "Barcode Lookup"),
+            (self.test_food_tracking, "Food Tracking"),
+            (self.test_api_response_times, "Response Time"),
+            (self.test_error_handling, "Error Handling")
+        ]
+        # A test that raises past its own error handling is recorded as a failure in
+        # its category, so the summary can't report it as working, instead of
+        # aborting the rest of the run
+        outcomes = await asyncio.gather(*[test() for test, _ in tests], return_exceptions=True)
+        for (test, category), outcome in zip(tests, outcomes):
+            if isinstance(outcome, Exception):
+                self.log_test(f"{category} - {test.__name__}", False, f"Test crashed: {str(outcome)}")
+        self.print_results()
         
         # Summary
         print("\n" + "=" * 80)
@@ -628,7 +844,7 @@ class BackendTester:
         print("=" * 80)
         
         total_tests = len(self.test_results)
-        passed_tests = sum(1 for result in self.test_results if result["success"])
+        passed_tests = sum(self._cat_pass.values())
         failed_tests = total_tests - passed_tests
         
         print(f"Total Tests: {total_tests}")
@@ -645,81 +861,71 @@ class BackendTester:
         print("\n🎯 KEY FINDINGS:")
         
         # Indian OpenFoodFacts Integration
-        indian_search_tests = [r for r in self.test_results if "Indian Food Search" in r["test"] or "Indian OpenFoodFacts Integration" in r["test"]]
-        indian_search_success = sum(1 for r in indian_search_tests if r["success"])
+        indian_search_success, indian_search_total = self._tally("Indian Food Search")
         if indian_search_success > 0:
-            print(f"  ✅ Indian OpenFoodFacts Integration: Working ({indian_search_success}/{len(indian_search_tests)} tests passed)")
+            print(f"  ✅ Indian OpenFoodFacts Integration: Working ({indian_search_success}/{indian_search_total} tests passed)")
         else:
             print(f"  ❌ Indian OpenFoodFacts Integration: Failed")
         
         # Indian Food Categories
-        categories_tests = [r for r in self.test_results if "Indian Food Categories" in r["test"]]
-        categories_success = sum(1 for r in categories_tests if r["success"])
+        categories_success, _ = self._tally("Indian Food Categories API")
         if categories_success > 0:
             print(f"  ✅ Indian Food Categories API: Working")
         else:
             print(f"  ❌ Indian Food Categories API: Failed")
         
         # Indian Brand Prioritization
-        brand_tests = [r for r in self.test_results if "Indian Brand" in r["test"]]
-        brand_success = sum(1 for r in brand_tests if r["success"])
+        brand_success, brand_total = self._tally("Indian Brand Priority")
         if brand_success > 0:
-            print(f"  ✅ Indian Brand Prioritization: Working ({brand_success}/{len(brand_tests)} tests passed)")
+            print(f"  ✅ Indian Brand Prioritization: Working ({brand_success}/{brand_total} tests passed)")
         else:
             print(f"  ❌ Indian Brand Prioritization: Failed")
         
         # Popular Indian Foods API
-        popular_tests = [r for r in self.test_results if "Popular Indian Foods" in r["test"]]
-        popular_success = sum(1 for r in popular_tests if r["success"])
+        popular_success, _ = self._tally("Popular Indian Foods API")
         if popular_success > 0:
             print(f"  ✅ Popular Indian Foods API: Working")
         else:
             print(f"  ❌ Popular Indian Foods API: Failed")
         
         # Enhanced Barcode Lookup
-        enhanced_barcode_tests = [r for r in self.test_results if "Enhanced Barcode" in r["test"]]
-        enhanced_barcode_success = sum(1 for r in enhanced_barcode_tests if r["success"])
+        enhanced_barcode_success, enhanced_barcode_total = self._tally("Enhanced Barcode")
         if enhanced_barcode_success > 0:
-            print(f"  ✅ Enhanced Barcode Lookup: Working ({enhanced_barcode_success}/{len(enhanced_barcode_tests)} tests passed)")
+            print(f"  ✅ Enhanced Barcode Lookup: Working ({enhanced_barcode_success}/{enhanced_barcode_total} tests passed)")
         else:
             print(f"  ❌ Enhanced Barcode Lookup: Failed")
         
         # Indian Nutritional Guidelines
-        nutrition_tests = [r for r in self.test_results if "Indian Nutrition" in r["test"] or "Indian Nutritional Guidelines" in r["test"]]
-        nutrition_success = sum(1 for r in nutrition_tests if r["success"])
+        nutrition_success, nutrition_total = self._tally("Indian Nutrition")
         if nutrition_success > 0:
-            print(f"  ✅ Indian Nutritional Guidelines: Working ({nutrition_success}/{len(nutrition_tests)} tests passed)")
+            print(f"  ✅ Indian Nutritional Guidelines: Working ({nutrition_success}/{nutrition_total} tests passed)")
         else:
             print(f"  ❌ Indian Nutritional Guidelines: Failed")
         
         # OpenFoodFacts Integration
-        search_tests = [r for r in self.test_results if "Food Search" in r["test"] and "Indian" not in r["test"]]
-        search_success = sum(1 for r in search_tests if r["success"])
+        search_success, search_total = self._tally("Food Search")
         if search_success > 0:
-            print(f"  ✅ General OpenFoodFacts API Integration: Working ({search_success}/{len(search_tests)} queries successful)")
+            print(f"  ✅ General OpenFoodFacts API Integration: Working ({search_success}/{search_total} queries successful)")
         else:
             print(f"  ❌ General OpenFoodFacts API Integration: Failed")
         
         # Health Scoring
-        scoring_tests = [r for r in self.test_results if "Health Scoring" in r["test"] and "Indian" not in r["test"]]
-        scoring_success = sum(1 for r in scoring_tests if r["success"])
-        if scoring_success == len(scoring_tests) and len(scoring_tests) > 0:
+        scoring_success, scoring_total = self._tally("Health Scoring")
+        if scoring_success == scoring_total and scoring_total > 0:
             print(f"  ✅ General Health Scoring Algorithm: Working correctly")
         else:
             print(f"  ❌ General Health Scoring Algorithm: Issues detected")
         
         # Barcode Lookup
-        barcode_tests = [r for r in self.test_results if "Barcode Lookup" in r["test"] and "Enhanced" not in r["test"]]
-        barcode_success = sum(1 for r in barcode_tests if r["success"])
+        barcode_success, barcode_total = self._tally("Barcode Lookup")
         if barcode_success > 0:
-            print(f"  ✅ General Barcode Lookup: Working ({barcode_success}/{len(barcode_tests)} lookups successful)")
+            print(f"  ✅ General Barcode Lookup: Working ({barcode_success}/{barcode_total} lookups successful)")
         else:
             print(f"  ❌ General Barcode Lookup: Failed")
         
         # Food Tracking
-        tracking_tests = [r for r in self.test_results if "Food Tracking" in r["test"]]
-        tracking_success = sum(1 for r in tracking_tests if r["success"])
-        if tracking_success == len(tracking_tests) and len(tracking_tests) > 0:
+        tracking_success, tracking_total = self._tally("Food Tracking")
+        if tracking_success == tracking_total and tracking_total > 0:
             print(f"  ✅ Food Tracking: Working correctly")
         else:
             print(f"  ❌ Food Tracking: Issues detected")
@@ -728,30 +934,38 @@ class BackendTester:
 
 async def main():
     """Main test runner"""
-    tester = BackendTester()
     try:
-        passed, failed, results = await tester.run_all_tests()
-        
-        # Save detailed results
-        with open("/app/backend_test_results.json", "w") as f:
-            json.dump({
-                "summary": {
-                    "total": len(results),
-                    "passed": passed,
-                    "failed": failed,
-                    "success_rate": (passed/len(results))*100 if results else 0
-                },
-                "results": results,
-                "timestamp": datetime.now().isoformat()
-            }, f, indent=2)
-        
-        print(f"\n📄 Detailed results saved to: /app/backend_test_results.json")
+        async with BackendTester(verbose="-v" in sys.argv[1:]) as tester:
+            passed, failed, results = await tester.run_all_tests()
+        
+        # Save detailed results; the file write runs in a worker thread so it
+        # doesn't block the event loop
+        report = orjson.dumps({
+            "summary": {
+                "total": len(results),
+                "passed": passed,
+                "failed": failed,
+                "success_rate": (passed/len(results))*100 if results else 0
+            },
+            "results": [{**r, "timestamp": datetime.fromtimestamp(r["timestamp"])} for r in results],
+            "timestamp": datetime.now()
+        }, option=orjson.OPT_INDENT_2)
+        await asyncio.to_thread(RESULTS_PATH.write_bytes, report)
+        
+        print(f"\n📄 Detailed results saved to: {RESULTS_PATH}")
         
         # Exit with appropriate code
         sys.exit(0 if failed == 0 else 1)
         
     finally:
-        await tester.close()
+        await close_client()
 
 if __name__ == "__main__":
+    # uvloop's libuv event loop (requirements-test.txt) is faster for this
+    # request-heavy run; fall back to the default loop where it isn't installed
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())
\ No newline at end of file
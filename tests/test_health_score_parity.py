@@ -0,0 +1,87 @@
+"""The batch (NumPy) and per-product health scoring paths must agree"""
+
+import itertools
+import random
+import unittest
+
+from backend.server import HealthScoreCalculator, NutritionInfo
+
+# Values around each rule threshold in _score_kernel, plus missing and zero
+FIELD_EDGES = {
+    "energy_100g": [None, 0, 350, 350.1, 510, 590, 2000],
+    "sugars_100g": [None, 0, 12, 12.1, 24.5, 100],
+    "sodium_100g": [None, 0, 1.2, 1.21, 2.866, 10],
+    "salt_100g": [None, 0, 3, 3.1, 7, 50],
+    "saturated_fat_100g": [None, 0, 6, 6.1, 16, 60],
+    "fiber_100g": [None, 0, 2, 2.1, 7, 30],
+    "proteins_100g": [None, 0, 8, 8.1, 18, 60],
+    "carbohydrates_100g": [None, 0, 70, 70.1, 100, 120],
+}
+NUTRISCORE_GRADES = [None, "", "a", "b", "c", "d", "e", "A", "E", "z"]
+NOVA_GROUPS = [None, 0, 1, 2, 3, 4, 5]
+ADDITIVE_COUNTS = [None, 0, 1, 5, 6, 7, 20]
+
+
+def _additives(count):
+    return None if count is None else [f"e{100 + i}" for i in range(count)]
+
+
+class HealthScoreParityTest(unittest.TestCase):
+    def assert_parity(self, items):
+        batch = HealthScoreCalculator.calculate_health_scores(items)
+        single = [HealthScoreCalculator.calculate_health_score(*item) for item in items]
+        for item, got, expected in zip(items, batch, single):
+            self.assertEqual(got, expected, msg=repr(item))
+        self.assertEqual(len(batch), len(single))
+
+    def test_each_nutrient_threshold(self):
+        items = [
+            (NutritionInfo(**{field: value}), None, None, None)
+            for field, values in FIELD_EDGES.items()
+            for value in values
+        ]
+        # Sodium takes precedence over salt only when it is over its own threshold
+        items += [
+            (NutritionInfo(sodium_100g=sodium, salt_100g=salt), None, None, None)
+            for sodium, salt in itertools.product(FIELD_EDGES["sodium_100g"], FIELD_EDGES["salt_100g"])
+        ]
+        items.append((None, None, None, None))
+        self.assert_parity(items)
+
+    def test_grade_group_and_additive_edges(self):
+        items = [
+            (NutritionInfo(), grade, nova, _additives(count))
+            for grade, nova, count in itertools.product(NUTRISCORE_GRADES, NOVA_GROUPS, ADDITIVE_COUNTS)
+        ]
+        self.assert_parity(items)
+
+    def test_rating_boundaries(self):
+        items = [
+            (NutritionInfo(), None, None, _additives(5)),  # exactly 85
+            (NutritionInfo(), None, 4, None),  # exactly 70
+            (NutritionInfo(), None, 4, _additives(5)),  # exactly 55
+            (NutritionInfo(), "e", 4, None),  # exactly 40
+            (NutritionInfo(energy_100g=510), "c", 4, None),  # exactly 40
+            (NutritionInfo(energy_100g=2000, sugars_100g=100), "e", 4, _additives(20)),  # clamped to 0
+            (NutritionInfo(fiber_100g=30, proteins_100g=60), "a", 1, None),  # clamped to 100
+        ]
+        self.assert_parity(items)
+
+    def test_random_products(self):
+        rng = random.Random(1234)
+        items = []
+        for _ in range(2000):
+            nutrition = NutritionInfo(**{
+                field: rng.choice([None, rng.choice(values), rng.uniform(0, max(v for v in values if v))])
+                for field, values in FIELD_EDGES.items()
+            })
+            items.append((nutrition, rng.choice(NUTRISCORE_GRADES), rng.choice(NOVA_GROUPS),
+                          _additives(rng.choice(ADDITIVE_COUNTS))))
+        self.assert_parity(items)
+
+    def test_empty_batch(self):
+        self.assertEqual(HealthScoreCalculator.calculate_health_scores([]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()